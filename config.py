@@ -18,6 +18,12 @@ LEVEL_TO_SCENARIO_MAPPING = {
 }
 MAX_AVAILABLE_LEVEL = max(LEVEL_TO_SCENARIO_MAPPING.keys())
 
+# Level whose evaluation result carries a strategy analysis
+STRATEGY_ANALYSIS_LEVEL = 3
+
+# Challenge levels and their display names
+CHALLENGE_LEVELS = {3.5: "Challenge Level 3.5"}
+
 # File Paths
 SCENARIOS_FOLDER = "prompts/scenarios"
 RECIPIENTS_FOLDER = "prompts/recipients"
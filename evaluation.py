@@ -5,6 +5,7 @@ This module handles the email evaluation workflow, including
 AI generation, evaluation, and result processing.
 """
 
+import html
 import json
 import logging
 import streamlit as st
@@ -25,6 +26,12 @@ from utils import (
 )
 from session_manager import is_game_complete
 
+# Outcome-to-icon mapping for the majority reply debug display
+_OUTCOME_ICONS = {
+    'PASS': '✅',
+    'FAIL': '❌'
+}
+
 
 def _display_majority_reply_debug(reply_result: dict, expanded: bool = False, unique_id: str = ""):
     """
@@ -47,37 +54,33 @@ def _display_majority_reply_debug(reply_result: dict, expanded: bool = False, un
     selected_reply = reply_result.get('reply', '')
     
     with st.expander(f"🔍 Debug: Majority Reply Analysis ({len(all_replies)} samples)", expanded=expanded):
-        st.markdown(f"**Majority Outcome:** `{majority_outcome}`")
-        st.markdown(f"**Distribution:** {dict(outcome_counts)}")
-        
-        # Show all replies with their outcomes (without nested expanders)
-        st.markdown("**All Generated Replies:**")
+        # Plain-text labels avoid a markdown parse per element
+        dist_str = ", ".join(f"{k}:{v}" for k, v in outcome_counts.items())
+        st.text(
+            f"Majority Outcome: {majority_outcome}\n"
+            f"Distribution: {dist_str}\n"
+            "All Generated Replies:"
+        )
         for i, (reply, outcome) in enumerate(zip(all_replies, outcomes)):
             is_selected = reply == selected_reply
             status_icon = "👑" if is_selected else "📧"
-            outcome_color = {
-                'PASS': '✅',
-                'FAIL': '❌'
-            }.get(outcome, '⚪')
-            
+            outcome_color = _OUTCOME_ICONS.get(outcome, '⚪')
+
             selection_text = " (SELECTED)" if is_selected else ""
-            st.markdown(f"{status_icon} **Reply {i+1}** - {outcome_color} {outcome}{selection_text}")
-            
+            st.text(f"{status_icon} Reply {i+1} - {outcome_color} {outcome}{selection_text}")
+
             # Show reply content
-            st.markdown("**Reply Content:**")
             st.code(reply, language=None)
-            
-            # Show evaluation for this reply
+
+            # Show evaluation for this reply. Keep full evaluation text so
+            # decision isn't cut off; a collapsed <details> block is much
+            # lighter than a disabled text_area widget
             if i < len(evaluations):
-                st.markdown("**Evaluation:**")
                 evaluation_text = evaluations[i]
-                # Keep full evaluation text so decision isn't cut off
-                st.text_area(
-                    f"Evaluation for Reply {i+1}",
-                    value=evaluation_text,
-                    height=200,
-                    key=f"eval_debug_{unique_id}_{i}_{hash(reply[:20])}",
-                    disabled=True
+                st.markdown(
+                    f'<details><summary>Evaluation for Reply {i+1}</summary>'
+                    f'<pre style="white-space: pre-wrap;">{html.escape(evaluation_text)}</pre></details>',
+                    unsafe_allow_html=True
                 )
             
             if i < len(all_replies) - 1:  # Not the last reply
@@ -393,6 +396,7 @@ def process_email_evaluation_user_mode_inline(scenario, email_content, model, le
                 # Store debug info in session state
                 if 'debug_reply_data' not in st.session_state:
                     st.session_state.debug_reply_data = {}
+                recipient_debug_data['_is_multi'] = True
                 st.session_state.debug_reply_data[level] = recipient_debug_data
             else:
                 # Single recipient scenario
@@ -422,6 +426,7 @@ def process_email_evaluation_user_mode_inline(scenario, email_content, model, le
                 # Store debug info in session state
                 if 'debug_reply_data' not in st.session_state:
                     st.session_state.debug_reply_data = {}
+                reply_result['_is_multi'] = False
                 st.session_state.debug_reply_data[level] = reply_result
                 
                 # Game Master workflow for scenarios with GM
@@ -655,6 +660,7 @@ def process_email_evaluation_user_mode_multi_turn(scenario, email_content, model
                     # Store debug info in session state
                     if 'debug_reply_data' not in st.session_state:
                         st.session_state.debug_reply_data = {}
+                    reply_result['_is_multi'] = False
                     st.session_state.debug_reply_data[level] = reply_result
                 
                 if turn_number > MAX_TURNS:
@@ -665,6 +671,10 @@ def process_email_evaluation_user_mode_multi_turn(scenario, email_content, model
             if not submission_id:
                 st.error("Failed to save email submission")
                 return
+
+            # Invalidate the cached conversation history for this level
+            from ui_components.turn_management import bump_history_version
+            bump_history_version(session_id, level)
             
             # Step 3: Generate rubric (optional)
             rubric = _generate_rubric_if_enabled(ai_services['rubric_generator'], scenario, model)
@@ -1000,6 +1010,7 @@ def process_email_evaluation_developer_mode(scenario, email_content, model):
             if 'debug_reply_data' not in st.session_state:
                 st.session_state.debug_reply_data = {}
             current_level = st.session_state.get('current_level', 0)
+            reply_result['_is_multi'] = False
             st.session_state.debug_reply_data[current_level] = reply_result
             
             # Game Master workflow for scenarios with GM
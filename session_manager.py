@@ -5,8 +5,11 @@ Handles all session-related operations for the Email Game application.
 Provides functions for creating, loading, and managing game sessions using UUIDs.
 """
 
+import atexit
+import threading
 import uuid
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Set, Any, List
 from datetime import datetime
 from database.connection import get_database_session, init_database
@@ -20,6 +23,9 @@ from config import MAX_TURNS, MULTI_TURN_LEVELS
 
 logger = logging.getLogger(__name__)
 
+# Core levels required to finish the game (excludes conditional level 3.5)
+CORE_REQUIRED_LEVELS = frozenset({0, 1, 2, 3, 4, 5})
+
 # Ensure database is initialized when module is imported
 init_database()
 
@@ -231,6 +237,76 @@ def save_session_progress(session_id: str, current_level: float, completed_level
         db_session.close()
 
 
+def save_current_level(session_id: str, current_level: float) -> bool:
+    """
+    Persist only the player's current level.
+
+    Navigation clicks change nothing else, so this issues a targeted
+    UPDATE instead of rewriting the level-completion rows like
+    save_session_progress does.
+
+    Args:
+        session_id: Session ID
+        current_level: Current level user is on (int or float for levels like 2.5)
+
+    Returns:
+        bool: True if save successful, False otherwise
+    """
+    db_session = get_database_session()
+
+    try:
+        updated = db_session.query(GameSession).filter_by(session_id=session_id).update({
+            'current_level': current_level,
+            'last_accessed': datetime.utcnow()
+        })
+        db_session.commit()
+
+        if not updated:
+            logger.error(f"Session {session_id} not found for current-level save")
+            return False
+
+        logger.info(f"Saved current level {current_level} for session {session_id}")
+        return True
+
+    except Exception as e:
+        db_session.rollback()
+        logger.error(f"Failed to save current level for session {session_id}: {str(e)}")
+        return False
+    finally:
+        db_session.close()
+
+
+# Background current-level saves: a single worker keeps writes ordered while
+# the UI thread returns immediately. Pending saves are coalesced per session
+# so rapid navigation only writes the latest level. Only the targeted
+# current-level write goes through this queue; full progress saves stay
+# synchronous so a completed_levels write can never be coalesced away.
+_save_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="session-save")
+_pending_saves: Dict[str, float] = {}
+_pending_saves_lock = threading.Lock()
+
+
+def _flush_pending_save(session_id: str) -> None:
+    """Worker task: write the most recent queued level for a session"""
+    with _pending_saves_lock:
+        pending = _pending_saves.pop(session_id, None)
+    if pending is not None:
+        save_current_level(session_id, pending)
+
+
+def save_current_level_async(session_id: str, current_level: float) -> None:
+    """Queue a targeted current-level save without blocking the caller"""
+    with _pending_saves_lock:
+        already_queued = session_id in _pending_saves
+        _pending_saves[session_id] = current_level
+    if not already_queued:
+        _save_executor.submit(_flush_pending_save, session_id)
+
+
+# Flush queued saves before the process exits
+atexit.register(_save_executor.shutdown, wait=True)
+
+
 def save_email_submission(session_id: str, level: float, email_content: str, turn_number: int = 1) -> Optional[int]:
     """
     Save an email submission to database.
@@ -636,11 +712,8 @@ def is_game_complete(session_id: str) -> bool:
         
         completed_levels = {comp.level for comp in completions}
         
-        # Core required levels (excluding conditional level 3.5)
-        core_required_levels = {0, 1, 2, 3, 4, 5}
-        
         # Check if all core levels are completed
-        core_completed = core_required_levels.issubset(completed_levels)
+        core_completed = CORE_REQUIRED_LEVELS.issubset(completed_levels)
         
         # If player accessed level 3.5, it must also be completed
         level_3_5_requirement_met = True
@@ -5,6 +5,9 @@ This module contains the main UI components including mode selection
 and developer interface components.
 """
 
+from collections import ChainMap
+from functools import lru_cache
+
 import streamlit as st
 from config import (
     DEFAULT_SCENARIO,
@@ -23,49 +26,69 @@ from ui_user import show_user_interface_with_levels
 from evaluation import process_email_evaluation_developer_mode
 
 
+# Static markup for the mode-selection page. Built once at import time so each
+# rerun reuses the same string objects instead of reallocating them.
+_MODE_SELECTION_CSS = """
+<style>
+.mode-header {
+    text-align: center;
+    padding: 2rem 0;
+}
+.mode-card {
+    background: #f8f9fa;
+    border-radius: 10px;
+    padding: 2rem;
+    margin: 1rem 0;
+    border-left: 5px solid #007bff;
+    height: 200px;
+    display: flex;
+    flex-direction: column;
+    justify-content: space-between;
+}
+.user-card {
+    border-left-color: #28a745 !important;
+}
+.dev-card {
+    border-left-color: #ffc107 !important;
+}
+</style>
+"""
+
+_MODE_HEADER_HTML = """
+<div class="mode-header">
+
+# 📧 The Ghostwriter
+</div>
+"""
+
+_USER_CARD_HTML = """
+<div class="mode-card user-card">
+<h3>👤 User Mode</h3>
+<p>Play as a user. Craft emails for increasingly difficult scenarios!</p>
+</div>
+"""
+
+_DEV_CARD_HTML = """
+<div class="mode-card dev-card">
+<h3>🛠️ Developer Mode</h3>
+<p>If you want to customize the scenario and prompts to models.</p>
+</div>
+"""
+
+
 def show_mode_selection():
     """Show the mode selection page"""
-    st.markdown("""
-    <style>
-    .mode-header {
-        text-align: center;
-        padding: 2rem 0;
-    }
-    .mode-card {
-        background: #f8f9fa;
-        border-radius: 10px;
-        padding: 2rem;
-        margin: 1rem 0;
-        border-left: 5px solid #007bff;
-        height: 200px;
-        display: flex;
-        flex-direction: column;
-        justify-content: space-between;
-    }
-    .user-card {
-        border-left-color: #28a745 !important;
-    }
-    .dev-card {
-        border-left-color: #ffc107 !important;
-    }
-    </style>
-    
-    <div class="mode-header">
-    
-    # 📧 The Ghostwriter
-    </div>
-    """, unsafe_allow_html=True)
-    
+    # Emit the prebuilt CSS on every run; a session-gated emit would drop
+    # the styles after the first rerun
+    st.markdown(_MODE_SELECTION_CSS, unsafe_allow_html=True)
+
+    st.markdown(_MODE_HEADER_HTML, unsafe_allow_html=True)
+
     # Create two columns for the mode selection
     col1, col2 = st.columns(2)
-    
+
     with col1:
-        st.markdown("""
-        <div class="mode-card user-card">
-        <h3>👤 User Mode</h3>
-        <p>Play as a user. Craft emails for increasingly difficult scenarios!</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_USER_CARD_HTML, unsafe_allow_html=True)
         
         if st.button("🚀 Play Now", type="primary", use_container_width=True):
             st.session_state.app_mode = "user"
@@ -74,12 +97,7 @@ def show_mode_selection():
             st.rerun()
     
     with col2:
-        st.markdown("""
-        <div class="mode-card dev-card">
-        <h3>🛠️ Developer Mode</h3>
-        <p>If you want to customize the scenario and prompts to models.</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_DEV_CARD_HTML, unsafe_allow_html=True)
         
         if st.button("⚙️ Run As Developer", type="secondary", use_container_width=True):
             st.session_state.app_mode = "developer"
@@ -102,29 +120,46 @@ def show_developer_interface(available_scenarios, api_keys_available):
     # Sidebar for configuration
     with st.sidebar:
         st.subheader("Configuration")
-        
-        # API Key status
-        from ui_components.shared_components import show_api_key_status
-        show_api_key_status(api_keys_available)
-        
+
+        # API key status as a single markdown element instead of separate
+        # success/error/info widgets
+        if api_keys_available:
+            api_status = "✅ API keys loaded from environment"
+        else:
+            api_status = "❌ Missing API keys\n\nSet OPENAI_API_KEY_CLAB environment variable"
+        st.markdown(api_status)
+
         # Model selection
         model = st.selectbox(
             "Evaluator Model",
             ["gpt-4o"],
             help="Select the model to evaluate emails"
         )
-        
+
         # Rubric toggle
         st.session_state.use_rubric = st.checkbox(
             "📏 Use Evaluation Rubric",
             value=st.session_state.get('use_rubric', True),
             help="Toggle whether to generate and display evaluation rubrics"
         )
-        
-        st.markdown("---")
-        st.markdown("**Scenarios**")
-        from ui_components.shared_components import show_scenario_loading_status
-        show_scenario_loading_status(len(available_scenarios) if available_scenarios else 0)
+
+        # Debug panel toggle (off by default so the debug path stays out of
+        # the normal render loop)
+        st.checkbox(
+            "🔍 Show Debug Panels",
+            key='show_debug_panels',
+            help="Render the majority-reply debug analysis on results pages"
+        )
+
+        st.divider()
+
+        # Scenario heading and loading status combined into one element
+        num_scenarios = len(available_scenarios) if available_scenarios else 0
+        if num_scenarios > 0:
+            scenario_status = f"**Scenarios**\n\nLoaded {num_scenarios} scenario(s)"
+        else:
+            scenario_status = "**Scenarios**\n\n⚠️ No scenarios found in manual folder"
+        st.markdown(scenario_status)
     
     # Main content area
     col1, col2 = st.columns([2, 1])
@@ -296,10 +331,8 @@ def _ensure_session_in_url():
         session_id = st.session_state.get('game_session_id')
         
         if session_id:
-            from session_manager import session_exists
-            
-            # Verify session still exists in database
-            if session_exists(session_id):
+            # Verify session still exists in database (memoized)
+            if _session_exists_cached(session_id):
                 # Sync session state with database to ensure consistency
                 _sync_session_state_with_database(session_id)
                 
@@ -386,8 +419,32 @@ def _sync_session_state_with_database(session_id: str):
         pass
 
 
+@st.cache_data(ttl=30, show_spinner=False)
+def _session_exists_cached(session_id: str) -> bool:
+    """Cached session-existence check to avoid repeated DB hits per rerun.
+
+    The short TTL matters: a negative result must expire so a session
+    created elsewhere (another tab, a shared link used early) becomes
+    reachable without a server restart.
+    """
+    from session_manager import session_exists
+    return session_exists(session_id)
+
+
+@lru_cache(maxsize=None)
+def _prereq_set(target_level: float) -> frozenset:
+    """Levels that must be unlocked before jumping to target_level."""
+    from config import LEVEL_TO_SCENARIO_MAPPING
+    return frozenset(level for level in LEVEL_TO_SCENARIO_MAPPING if level < target_level)
+
+
 def _handle_url_parameters():
     """Handle URL parameters for developer navigation"""
+    # Fast path: the vast majority of reruns carry no navigation parameter,
+    # so bail out before any query-param copying or try/except setup
+    if 'gang_level' not in st.query_params:
+        return
+
     try:
         # Get URL parameters
         query_params = st.query_params
@@ -414,13 +471,12 @@ def _handle_url_parameters():
                 # Check if there's an active session we can use
                 active_session_id = st.session_state.get('game_session_id')
                 if active_session_id:
-                    from session_manager import session_exists
-                    if session_exists(active_session_id):
+                    if _session_exists_cached(active_session_id):
                         # Automatically use the active session
                         # st.info(f"🔗 **Auto-using active session:** {active_session_id[:8]}... (you can override with `?session=OTHER_ID&gang_level=X`)")
-                        # Add session to query params for processing
-                        query_params = dict(query_params)  # Convert to mutable dict
-                        query_params['session'] = active_session_id
+                        # Overlay the session onto the query params without
+                        # copying the whole mapping
+                        query_params = ChainMap({'session': active_session_id}, st.query_params)
                     else:
                         # Session in state doesn't exist in DB, clear it
                         if 'game_session_id' in st.session_state:
@@ -437,7 +493,7 @@ def _handle_url_parameters():
                 
                 # Import here to avoid circular imports
                 from config import LEVEL_TO_SCENARIO_MAPPING
-                from session_manager import unlock_levels_up_to, session_exists, create_new_session
+                from session_manager import unlock_levels_up_to, create_new_session
                 
                 # Validate level exists in mapping
                 if target_level in LEVEL_TO_SCENARIO_MAPPING:
@@ -447,7 +503,7 @@ def _handle_url_parameters():
                     # First, check if session ID is provided in URL
                     if 'session' in query_params:
                         url_session_id = query_params['session']
-                        if session_exists(url_session_id):
+                        if _session_exists_cached(url_session_id):
                             session_id = url_session_id
                             st.session_state.game_session_id = session_id
                             # st.info(f"🔗 **Using session from URL:** {session_id[:8]}...")
@@ -458,7 +514,7 @@ def _handle_url_parameters():
                     # Second, check if there's already an active session
                     elif st.session_state.get('game_session_id'):
                         existing_session_id = st.session_state.get('game_session_id')
-                        if session_exists(existing_session_id):
+                        if _session_exists_cached(existing_session_id):
                             session_id = existing_session_id
                             # st.info(f"🔄 **Using existing session:** {session_id[:8]}...")
                         else:
@@ -468,6 +524,8 @@ def _handle_url_parameters():
                     # Third, create a new session if none exists
                     if not session_id:
                         session_id = create_new_session()
+                        # New session invalidates any cached negative lookups
+                        _session_exists_cached.clear()
                         st.session_state.game_session_id = session_id
                         # st.info(f"🆕 **Created new session:** {session_id[:8]}...")
                     
@@ -508,11 +566,8 @@ def _handle_url_parameters():
                             database_completed = existing_session_data.get('completed_levels', set())
                         
                         # Get prerequisites needed for target level
-                        prerequisite_levels = set()
-                        for level in LEVEL_TO_SCENARIO_MAPPING.keys():
-                            if level < target_level:  
-                                prerequisite_levels.add(level)
-                        
+                        prerequisite_levels = _prereq_set(target_level)
+
                         # STEP 2: Merge ALL progress sources (union of all sets)
                         all_completed_levels = session_state_completed | database_completed | prerequisite_levels
                         
@@ -524,13 +579,22 @@ def _handle_url_parameters():
                         # Force save the complete merged progress back to database
                         save_session_progress(session_id, target_level, all_completed_levels)
                         
-                        # STEP 4: Show detailed progress information
+                        # STEP 4: Show progress information as one consolidated
+                        # message (a single element instead of several info calls)
                         mode_display = "Developer" if current_mode == 'developer' else "User"
-                        
+
                         # Calculate what was preserved vs what was added
                         user_progress = session_state_completed | database_completed  # All user progress
                         new_prerequisites = prerequisite_levels - user_progress  # Only new unlocks
-                        
+
+                        summary = (
+                            f"🔗 **Jumped to Level {target_level}** ({mode_display} mode) "
+                            f"using session {session_id[:8]}..."
+                        )
+                        if new_prerequisites:
+                            summary += f"\n\n🔓 **Unlocked prerequisites:** {sorted(new_prerequisites)}"
+                        st.success(summary)
+
                         # **FIX 1: Clear gang_level after processing to prevent refresh issues**
                         # Always clear gang_level parameter after successful processing
                         st.query_params.clear()
@@ -4,33 +4,81 @@ Evaluation Display Components
 Handles evaluation results and feedback display.
 """
 
+import json
+import re
+from functools import lru_cache
+
 import streamlit as st
-from config import MAX_AVAILABLE_LEVEL, MULTI_TURN_LEVELS, MAX_TURNS
+from config import (
+    CHALLENGE_LEVELS,
+    LEVEL_TO_SCENARIO_MAPPING,
+    MAX_AVAILABLE_LEVEL,
+    MULTI_TURN_LEVELS,
+    MAX_TURNS,
+    STRATEGY_ANALYSIS_LEVEL,
+)
+from session_manager import is_game_complete
 from utils import is_multi_recipient_scenario, process_evaluation_text
+from .html_helpers import create_recipient_reply_display
 from .shared_components import show_evaluation_styles
 from .shared_components import (
     create_success_message,
     create_strategy_warning,
     create_strategy_success
 )
+from .turn_management import handle_turn_restart
+
+
+@lru_cache(maxsize=1)
+def _nav_helpers():
+    """Resolve the ui_user navigation helpers once.
+
+    ui_user imports this module at load time, so a module-level import here
+    would be circular; the lru_cache keeps the deferred import one-time.
+    """
+    from ui_user import determine_next_level, clean_stale_level_data
+    return determine_next_level, clean_stale_level_data
 
 
+@st.cache_data(max_entries=256, show_spinner=False)
+def _cached_processed_evaluation(evaluation_text: str) -> str:
+    """Memoized wrapper around process_evaluation_text.
+
+    Evaluation strings are immutable once generated, so the HTML conversion
+    only needs to run once per unique evaluation instead of on every rerun.
+    """
+    return process_evaluation_text(evaluation_text)
+
+
+@st.fragment
 def show_level_results(level: float):
-    """Show the evaluation results for a level inline"""
-    
-    result = st.session_state.level_evaluations[level]
-    
-    # Check if game was just completed and trigger leaderboard
+    """Show the evaluation results for a level inline.
+
+    Runs as a fragment so interactions inside the results area (expanders,
+    debug widgets) rerun only this subtree instead of the whole script.
+    Navigation buttons that change app-level state rerun with scope="app".
+    """
+
+    # Check if game was just completed and trigger leaderboard before
+    # touching the evaluation data at all
     if st.session_state.get('game_completed', False):
         _show_game_completion()
         return
-    
-    # Success indicator first
-    st.markdown("---")
-    st.subheader("📊 Results")
-    
-    # Show goal achievement status prominently
-    _show_goal_achievement_status(result, level)
+
+    result = st.session_state.level_evaluations[level]
+
+
+    # Static chrome (divider, heading, goal banner) batched into one element
+    goal_achieved = result.get("goal_achieved")
+    header_parts = ["<hr>", "<h3>📊 Results</h3>"]
+    banner_html = _goal_banner_html(result, level, goal_achieved)
+    if banner_html:
+        header_parts.append(banner_html)
+    st.markdown("\n".join(header_parts), unsafe_allow_html=True)
+
+    # Strategy analysis keeps its interactive widgets
+    if goal_achieved and level == STRATEGY_ANALYSIS_LEVEL and "strategy_analysis" in result:
+        _show_strategy_analysis(result["strategy_analysis"])
     
     # DEBUG: Show persistent majority reply analysis (TODO: Remove after debugging)
     _show_debug_reply_analysis(level)
@@ -54,30 +102,35 @@ def show_level_results(level: float):
 def _show_game_completion():
     """Show game completion celebration"""
     st.success("🎊 **GAME COMPLETE!** 🎊")
-    st.balloons()  # Celebration animation!
+    # One-shot guard so repeated reruns with the flag still set don't
+    # re-trigger the animation payload
+    if not st.session_state.get('_balloons_shown'):
+        st.balloons()  # Celebration animation!
+        st.session_state._balloons_shown = True
     st.success("🏆 **You are now a Communication Master!** 🏆")
-    
-    # Wait a moment then redirect to leaderboard
-    import time
-    time.sleep(1)
+
+    # Redirect to leaderboard immediately; the balloons animation runs
+    # client-side so blocking the script thread here gains nothing
     st.session_state.show_leaderboard = True
     st.session_state.game_completed = False  # Clear the flag
-    st.rerun()
+    st.rerun(scope="app")
 
 
-def _show_goal_achievement_status(result: dict, level: float):
-    """Show goal achievement status"""
-    if "goal_achieved" in result:
-        if result["goal_achieved"]:
-            success_message = create_success_message(level)
-            st.success(success_message)
-            
-            # Show strategy analysis for Level 3
-            if level == 3 and "strategy_analysis" in result:
-                _show_strategy_analysis(result["strategy_analysis"])
-                
-        else:
-            st.error("❌ **Goal Not Achieved** - You can edit your email above and try again.")
+# Alert-styled banners matching st.success / st.error
+_SUCCESS_BANNER = "<div style='padding: 0.75rem 1rem; border-radius: 0.5rem; background-color: #d4edda; color: #155724;'>%s</div>"
+_FAILURE_BANNER = "<div style='padding: 0.75rem 1rem; border-radius: 0.5rem; background-color: #f8d7da; color: #721c24;'>❌ <strong>Goal Not Achieved</strong> - You can edit your email above and try again.</div>"
+
+_BOLD_RE = re.compile(r"\*\*(.+?)\*\*")
+
+
+def _goal_banner_html(result: dict, level: float, goal_achieved) -> str:
+    """Build the goal achievement banner as HTML, or '' if no goal info"""
+    if "goal_achieved" not in result:
+        return ""
+    if goal_achieved:
+        message = _BOLD_RE.sub(r"<strong>\1</strong>", create_success_message(level))
+        return _SUCCESS_BANNER % message
+    return _FAILURE_BANNER
 
 
 def _show_strategy_analysis(strategy_analysis: dict):
@@ -122,28 +175,26 @@ def _show_evaluation_section(result: dict):
     """Show evaluation section"""
     with st.expander("🤖 AI Evaluation", expanded=True):
         show_evaluation_styles()
-        processed_evaluation = process_evaluation_text(result["evaluation"])
+        processed_evaluation = _cached_processed_evaluation(result["evaluation"])
         st.markdown(f'<div class="evaluation-content">{processed_evaluation}</div>', unsafe_allow_html=True)
 
 
 def _show_navigation_options(level: float, result: dict):
     """Show navigation options after evaluation"""
     st.markdown("---")
-    
+
     # Show "Continue to Next Level" button if successful and next level exists
-    if result.get("goal_achieved"):
+    goal_achieved = result.get("goal_achieved")
+    if goal_achieved:
         _show_success_navigation(level)
-    
+
     # Show "Try Again" hint if unsuccessful
-    elif not result.get("goal_achieved"):
+    else:
         _show_failure_navigation(level, result)
 
 
 def _show_success_navigation(level: float):
     """Show navigation options for successful completion"""
-    from session_manager import is_game_complete
-    from ui_user import determine_next_level
-    
     # Check if this is the final level completion
     if level == MAX_AVAILABLE_LEVEL and is_game_complete(st.session_state.get('game_session_id')):
         _show_final_completion_options()
@@ -159,29 +210,28 @@ def _show_final_completion_options():
     with col1:
         if st.button("🏆 View Leaderboard", type="primary", use_container_width=True):
             st.session_state.show_leaderboard = True
-            st.rerun()
+            st.rerun(scope="app")
     
     with col2:
         if st.button("🎮 Play Again", use_container_width=True):
             # Clear current session and return to selection screen
             if 'game_session_id' in st.session_state:
                 del st.session_state.game_session_id
-            st.rerun()
+            st.rerun(scope="app")
 
 
 def _show_regular_progression_options(level: float):
     """Show regular level progression options"""
-    from config import LEVEL_TO_SCENARIO_MAPPING
-    from ui_user import determine_next_level, clean_stale_level_data
-    
+    determine_next_level, clean_stale_level_data = _nav_helpers()
+
     next_level = determine_next_level(level, st.session_state)
     
     if next_level is not None and next_level in LEVEL_TO_SCENARIO_MAPPING:
         # Determine button text based on level
         if next_level == 0:
             next_level_display = "Tutorial"
-        elif next_level == 3.5:
-            next_level_display = "Challenge Level 3.5"
+        elif next_level in CHALLENGE_LEVELS:
+            next_level_display = CHALLENGE_LEVELS[next_level]
         else:
             next_level_display = f"Level {next_level}"
         
@@ -207,7 +257,7 @@ def _show_regular_progression_options(level: float):
             if session_id:
                 _clear_url_navigation_state_for_evaluation(next_level, session_id)
             
-            st.rerun()
+            st.rerun(scope="app")
     else:
         # All levels completed!
         st.success("🎊 **Congratulations!** You've completed all available levels!")
@@ -227,11 +277,9 @@ def _show_multi_turn_restart_option(level: float):
     st.info("💡 **Level 4 ended after maximum turns.** You can restart the level to try a different approach.")
     
     if st.button("🔄 Restart Level 4", type="secondary", use_container_width=True):
-        from ui_components.turn_management import handle_turn_restart
-        
         session_id = st.session_state.get('game_session_id')
         if session_id and handle_turn_restart(session_id, level):
-            st.rerun()
+            st.rerun(scope="app")
 
 
 def show_evaluation_error(error_message: str):
@@ -264,7 +312,6 @@ def show_turn_evaluation_result(level: float, turn_number: int, goal_achieved: b
     # Show Adam's response
     if recipient_reply:
         st.markdown("**Adam's Response:**")
-        from .html_helpers import create_recipient_reply_display
         reply_html = create_recipient_reply_display(recipient_reply)
         st.markdown(reply_html, unsafe_allow_html=True)
 
@@ -272,80 +319,135 @@ def show_turn_evaluation_result(level: float, turn_number: int, goal_achieved: b
 def _clear_url_navigation_state_for_evaluation(level: float, session_id: str):
     """Clear URL navigation state when navigating via evaluation completion"""
     try:
-        import streamlit as st
-        
         # Clear URL navigation processing flags
         if 'url_navigation_processed' in st.session_state:
             del st.session_state.url_navigation_processed
             
-        # Update URL to show only session (no gang_level)
-        st.query_params.update({"session": session_id})
-        
+        # Update URL to show only session (no gang_level); skip the browser
+        # round-trip entirely when the URL is already in the right state
+        if "gang_level" in st.query_params:
+            del st.query_params["gang_level"]
+        if st.query_params.get("session") != session_id:
+            st.query_params.update({"session": session_id})
+
     except Exception as e:
         # URL updates are not critical
         pass 
 
 
+# Outcome-to-icon mapping shared by the debug panels
+_OUTCOME_ICONS = {
+    'PASS': '✅',
+    'FAIL': '❌'
+}
+
+# Single-pass HTML escaping for the batched builders; html.escape walks the
+# string once per replaced character, which adds up on multi-KB email blobs
+_HTML_ESCAPE_TABLE = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#x27;'
+})
+
+
+def _esc(text: str) -> str:
+    """HTML-escape text with a single translate pass"""
+    return text.translate(_HTML_ESCAPE_TABLE)
+
+
+def _dist_str(outcome_counts) -> str:
+    """Format an outcome-count mapping as a compact display string"""
+    return ", ".join(f"{outcome}:{count}" for outcome, count in outcome_counts.items())
+
+
+def _build_reply_analysis_html(all_replies, outcomes, evaluations, selected_reply):
+    """Build the reply-by-reply analysis markup as a single HTML string"""
+    parts = []
+    # Fuse the ragged lists once up front so the loop body carries no
+    # per-iteration bounds checks
+    n = min(len(all_replies), len(outcomes))
+    padded_evaluations = list(evaluations[:n]) + [""] * (n - len(evaluations[:n]))
+    triples = list(zip(all_replies[:n], outcomes[:n], padded_evaluations))
+    last_idx = len(triples) - 1
+
+    for i, (reply, outcome, evaluation_text) in enumerate(triples):
+        is_selected = reply == selected_reply
+        status_icon = "👑" if is_selected else "📧"
+        outcome_color = _OUTCOME_ICONS.get(outcome, '⚪')
+        selection_text = " (SELECTED)" if is_selected else ""
+
+        parts.append(f"<p>{status_icon} <strong>Reply {i+1}</strong> - {outcome_color} {outcome}{selection_text}</p>")
+        parts.append("<p><strong>Reply Content:</strong></p>")
+        parts.append(f"<pre style='white-space: pre-wrap;'>{_esc(reply)}</pre>")
+
+        # Keep full evaluation text so decision isn't cut off; a <details>
+        # block lets the browser own the toggle with no server rerun
+        if evaluation_text:
+            parts.append(
+                f"<details><summary>Reply {i+1} Evaluation</summary>"
+                f"<pre style='white-space: pre-wrap;'>{_esc(evaluation_text)}</pre></details>"
+            )
+
+        if i != last_idx:  # Not the last reply
+            parts.append("<hr>")
+
+    return "\n".join(parts)
+
+
+@st.fragment
 def _show_debug_reply_analysis(level: float):
-    """Show persistent debug information from majority reply analysis"""
+    """Show persistent debug information from majority reply analysis
+
+    Runs as a fragment so toggling the panel reruns only this subtree.
+    """
+    # Debug panels are opt-in; skip the whole path unless enabled
+    if not st.session_state.get('show_debug_panels', False):
+        return
+
     # Check if debug data exists for this level
     debug_data = st.session_state.get('debug_reply_data', {}).get(level)
-    
+
     if not debug_data:
         return
-    
-    # Check if this is multi-recipient data (Level 2) or single recipient
-    if isinstance(debug_data, dict) and any(isinstance(v, dict) and 'all_replies' in v for v in debug_data.values()):
-        # Multi-recipient scenario (Level 2)
-        with st.expander(f"🔍 Debug: Multi-Recipient Majority Reply Analysis", expanded=False):
-            for recipient_name, reply_data in debug_data.items():
-                st.markdown(f"### {recipient_name.title()}'s Analysis")
-                
-                all_replies = reply_data.get('all_replies', [])
-                outcomes = reply_data.get('outcome_analysis', {}).get('outcomes', [])
-                evaluations = reply_data.get('outcome_analysis', {}).get('evaluations', [])
-                majority_outcome = reply_data.get('majority_outcome', 'Unknown')
-                outcome_counts = reply_data.get('outcome_counts', {})
-                selected_reply = reply_data.get('reply', '')
-                
-                st.markdown(f"**Majority Outcome:** `{majority_outcome}`")
-                st.markdown(f"**Distribution:** {dict(outcome_counts)}")
-                
-                # Show all replies with their outcomes
-                st.markdown(f"**{recipient_name.title()}'s Generated Replies:**")
-                for i, (reply, outcome) in enumerate(zip(all_replies, outcomes)):
-                    is_selected = reply == selected_reply
-                    status_icon = "👑" if is_selected else "📧"
-                    outcome_color = {
-                        'PASS': '✅',
-                        'FAIL': '❌'
-                    }.get(outcome, '⚪')
-                    
-                    selection_text = " (SELECTED)" if is_selected else ""
-                    st.markdown(f"{status_icon} **Reply {i+1}** - {outcome_color} {outcome}{selection_text}")
-                    
-                    # Show reply content
-                    st.markdown("**Reply Content:**")
-                    st.code(reply, language=None)
-                    
-                    # Show evaluation for this reply
-                    if i < len(evaluations):
-                        st.markdown("**Evaluation:**")
-                        evaluation_text = evaluations[i]
-                        # Keep full evaluation text so decision isn't cut off
-                        st.text_area(
-                            f"{recipient_name.title()} Reply {i+1} Evaluation",
-                            value=evaluation_text,
-                            height=200,
-                            key=f"eval_persist_{recipient_name}_{i}_{hash(reply[:20])}",
-                            disabled=True
-                        )
-                    
-                    if i < len(all_replies) - 1:  # Not the last reply
-                        st.markdown("---")
-                
-                if recipient_name != list(debug_data.keys())[-1]:  # Not the last recipient
-                    st.markdown("---")
+
+    # Check if this is multi-recipient data (Level 2) or single recipient.
+    # Writers store an '_is_multi' sentinel; fall back to scanning for data
+    # stored before the sentinel existed.
+    is_multi = debug_data.get('_is_multi') if isinstance(debug_data, dict) else False
+    if is_multi is None:
+        is_multi = any(isinstance(v, dict) and 'all_replies' in v for v in debug_data.values())
+
+    if is_multi:
+        # Multi-recipient scenario (Level 2). A toggle instead of a collapsed
+        # expander so the reply markup is only built when actually viewed.
+        if not st.toggle("🔍 Debug: Multi-Recipient Majority Reply Analysis", key=f"dbg_open_{level}"):
+            return
+        recipients = {name: data for name, data in debug_data.items() if name != '_is_multi'}
+        last_recipient = next(reversed(recipients))
+        sections = []
+        for recipient_name, reply_data in recipients.items():
+            all_replies = reply_data.get('all_replies', [])
+            outcomes = reply_data.get('outcome_analysis', {}).get('outcomes', [])
+            evaluations = reply_data.get('outcome_analysis', {}).get('evaluations', [])
+            majority_outcome = reply_data.get('majority_outcome', 'Unknown')
+            outcome_counts = reply_data.get('outcome_counts', {})
+            selected_reply = reply_data.get('reply', '')
+
+            sections.append(f"<h3>{_esc(recipient_name.title())}'s Analysis</h3>")
+            sections.append(f"<p><strong>Majority Outcome:</strong> <code>{_esc(str(majority_outcome))}</code></p>")
+            sections.append(f"<p><strong>Distribution:</strong> {_esc(_dist_str(outcome_counts))}</p>")
+
+            # Show all replies with their outcomes
+            sections.append(f"<p><strong>{_esc(recipient_name.title())}'s Generated Replies:</strong></p>")
+            sections.append(_build_reply_analysis_html(all_replies, outcomes, evaluations, selected_reply))
+
+            if recipient_name != last_recipient:  # Not the last recipient
+                sections.append("<hr>")
+
+        # Emit one markdown block to keep rerun cost flat
+        st.markdown("\n".join(sections), unsafe_allow_html=True)
     else:
         # Single recipient scenario
         all_replies = debug_data.get('all_replies', [])
@@ -357,47 +459,50 @@ def _show_debug_reply_analysis(level: float):
         
         if not all_replies:
             return
-        
-        with st.expander(f"🔍 Debug: Majority Reply Analysis ({len(all_replies)} samples)", expanded=False):
-            st.markdown(f"**Majority Outcome:** `{majority_outcome}`")
-            st.markdown(f"**Distribution:** {dict(outcome_counts)}")
-            
-            # Show all replies with their outcomes (without nested expanders)
-            st.markdown("**All Generated Replies:**")
-            for i, (reply, outcome) in enumerate(zip(all_replies, outcomes)):
-                is_selected = reply == selected_reply
-                status_icon = "👑" if is_selected else "📧"
-                outcome_color = {
-                    'PASS': '✅',
-                    'FAIL': '❌'
-                }.get(outcome, '⚪')
-                
-                selection_text = " (SELECTED)" if is_selected else ""
-                st.markdown(f"{status_icon} **Reply {i+1}** - {outcome_color} {outcome}{selection_text}")
-                
-                # Show reply content
-                st.markdown("**Reply Content:**")
-                st.code(reply, language=None)
-                
-                # Show evaluation for this reply
-                if i < len(evaluations):
-                    st.markdown("**Evaluation:**")
-                    evaluation_text = evaluations[i]
-                    # Keep full evaluation text so decision isn't cut off
-                    st.text_area(
-                        f"Reply {i+1} Evaluation",
-                        value=evaluation_text,
-                        height=200,
-                        key=f"eval_persist_single_{i}_{hash(reply[:20])}",
-                        disabled=True
-                    )
-                
-                if i < len(all_replies) - 1:  # Not the last reply
-                    st.markdown("---")
+
+        # A toggle instead of a collapsed expander so the reply markup is
+        # only built when actually viewed
+        if not st.toggle(f"🔍 Debug: Majority Reply Analysis ({len(all_replies)} samples)", key=f"dbg_open_{level}"):
+            return
+
+        # Emit one markdown block to keep rerun cost flat
+        sections = [
+            f"<p><strong>Majority Outcome:</strong> <code>{_esc(str(majority_outcome))}</code></p>",
+            f"<p><strong>Distribution:</strong> {_esc(_dist_str(outcome_counts))}</p>",
+            "<p><strong>All Generated Replies:</strong></p>",
+            _build_reply_analysis_html(all_replies, outcomes, evaluations, selected_reply),
+        ]
+        st.markdown("\n".join(sections), unsafe_allow_html=True)
+
+
+def _build_paraphrase_html(reply_label, paraphrases, outcomes, replies):
+    """Build the paraphrase-by-paraphrase results markup as one HTML string"""
+    parts = []
+    for i, (paraphrase, outcome, reply) in enumerate(zip(paraphrases, outcomes, replies)):
+        outcome_color = _OUTCOME_ICONS.get(outcome, '⚪')
+
+        parts.append(f"<p><strong>Paraphrase {i+1}</strong> - {outcome_color} {outcome}</p>")
+        parts.append("<p><strong>Paraphrased Email:</strong></p>")
+        parts.append(f"<pre style='white-space: pre-wrap;'>{_esc(paraphrase)}</pre>")
+
+        if reply:
+            parts.append(f"<p><strong>{_esc(reply_label)}:</strong></p>")
+            parts.append(f"<pre style='white-space: pre-wrap;'>{_esc(reply)}</pre>")
+        else:
+            parts.append(f"<p><strong>{_esc(reply_label)}:</strong> <em>Failed to generate</em></p>")
+
+        if i < len(paraphrases) - 1:  # Not the last paraphrase
+            parts.append("<hr>")
+
+    return "\n".join(parts)
 
 
+@st.fragment
 def show_consistency_analysis(level: float):
-    """Show consistency validation analysis for a level"""
+    """Show consistency validation analysis for a level
+
+    Runs as a fragment so expanding the panel reruns only this subtree.
+    """
     consistency_data = st.session_state.get('consistency_data', {}).get(level)
     
     if not consistency_data:
@@ -415,82 +520,68 @@ def show_consistency_analysis(level: float):
         expander_icon = "⚠️"
         expander_title = f"Email Consistency Validation - POTENTIALLY ADVERSARIAL ({consistency_score:.1%})"
     
-    with st.expander(f"{expander_icon} Debug: {expander_title}", expanded=False):
-        st.markdown(f"**Consistency Score:** `{consistency_score:.1%}`")
-        st.markdown(f"**Assessment:** {'CONSISTENT' if is_consistent else 'INCONSISTENT'}")
-        
-        if analysis:
-            st.markdown("**Analysis Summary:**")
-            st.text(analysis)
-        
-        if not is_consistent:
-            st.warning("⚠️ This email may be using adversarial techniques that don't work when paraphrased.")
-        else:
-            st.success("✅ This email appears to achieve its goal through genuine effective communication.")
-        
-        st.markdown("---")
-        
-        # Check if this is multi-recipient results
-        recipient_results = consistency_data.get('recipient_results')
-        if recipient_results:
-            # Multi-recipient scenario - show results for each recipient
-            st.markdown("**Multi-Recipient Paraphrase Testing Results:**")
-            for recipient_name, recipient_result in recipient_results.items():
-                st.markdown(f"### {recipient_name.title()}'s Consistency Results")
-                
-                paraphrases = recipient_result.get('paraphrases', [])
-                paraphrase_outcomes = recipient_result.get('paraphrase_outcomes', [])
-                paraphrase_replies = recipient_result.get('paraphrase_replies', [])
-                
-                for i, (paraphrase, outcome, reply) in enumerate(zip(paraphrases, paraphrase_outcomes, paraphrase_replies)):
-                    outcome_color = {
-                        'PASS': '✅',
-                        'FAIL': '❌'
-                    }.get(outcome, '⚪')
-                    
-                    st.markdown(f"**Paraphrase {i+1}** - {outcome_color} {outcome}")
-                    
-                    # Show paraphrase content
-                    st.markdown("**Paraphrased Email:**")
-                    st.code(paraphrase, language=None)
-                    
-                    # Show recipient reply
-                    if reply:
-                        st.markdown(f"**{recipient_name.title()}'s Reply:**")
-                        st.code(reply, language=None)
-                    else:
-                        st.markdown(f"**{recipient_name.title()}'s Reply:** *Failed to generate*")
-                    
-                    if i < len(paraphrases) - 1:  # Not the last paraphrase
-                        st.markdown("---")
-                
-                if recipient_name != list(recipient_results.keys())[-1]:  # Not the last recipient
-                    st.markdown("---")
-        else:
-            # Single recipient scenario - show paraphrase results
-            paraphrases = consistency_data.get('paraphrases', [])
-            paraphrase_outcomes = consistency_data.get('paraphrase_outcomes', [])
-            paraphrase_replies = consistency_data.get('paraphrase_replies', [])
-            
-            st.markdown("**Paraphrase Testing Results:**")
-            for i, (paraphrase, outcome, reply) in enumerate(zip(paraphrases, paraphrase_outcomes, paraphrase_replies)):
-                outcome_color = {
-                    'PASS': '✅',
-                    'FAIL': '❌'
-                }.get(outcome, '⚪')
-                
-                st.markdown(f"**Paraphrase {i+1}** - {outcome_color} {outcome}")
-                
-                # Show paraphrase content
-                st.markdown("**Paraphrased Email:**")
-                st.code(paraphrase, language=None)
-                
-                # Show recipient reply
-                if reply:
-                    st.markdown("**Recipient Reply:**")
-                    st.code(reply, language=None)
-                else:
-                    st.markdown("**Recipient Reply:** *Failed to generate*")
-                
-                if i < len(paraphrases) - 1:  # Not the last paraphrase
-                    st.markdown("---")
\ No newline at end of file
+    # A toggle instead of a collapsed expander so the analysis markup is
+    # only built when actually viewed
+    if not st.toggle(f"{expander_icon} Debug: {expander_title}", key=f"dbg_consistency_{level}"):
+        return
+
+    # Plain-text labels avoid a markdown parse per element
+    st.text(
+        f"Consistency Score: {consistency_score:.1%}\n"
+        f"Assessment: {'CONSISTENT' if is_consistent else 'INCONSISTENT'}"
+    )
+    
+    if analysis:
+        st.markdown("**Analysis Summary:**")
+        st.text(analysis)
+    
+    if not is_consistent:
+        st.warning("⚠️ This email may be using adversarial techniques that don't work when paraphrased.")
+    else:
+        st.success("✅ This email appears to achieve its goal through genuine effective communication.")
+    
+    st.markdown("---")
+    
+    # The consistency payload is written once per evaluation and never
+    # mutated, so the rendered markup can be cached on its serialized form
+    consistency_json = json.dumps(consistency_data, sort_keys=True, default=str)
+    st.markdown(_render_consistency_html(consistency_json), unsafe_allow_html=True)
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _render_consistency_html(consistency_json: str) -> str:
+    """Build the paraphrase-testing markup for one consistency payload"""
+    consistency_data = json.loads(consistency_json)
+
+    # Check if this is multi-recipient results
+    recipient_results = consistency_data.get('recipient_results')
+    if recipient_results:
+        # Multi-recipient scenario - show results for each recipient,
+        # batched into a single markdown element
+        last_recipient = next(reversed(recipient_results))
+        sections = ["<p><strong>Multi-Recipient Paraphrase Testing Results:</strong></p>"]
+        for recipient_name, recipient_result in recipient_results.items():
+            paraphrases = recipient_result.get('paraphrases', [])
+            paraphrase_outcomes = recipient_result.get('paraphrase_outcomes', [])
+            paraphrase_replies = recipient_result.get('paraphrase_replies', [])
+
+            sections.append(f"<h3>{_esc(recipient_name.title())}'s Consistency Results</h3>")
+            sections.append(_build_paraphrase_html(
+                f"{recipient_name.title()}'s Reply",
+                paraphrases, paraphrase_outcomes, paraphrase_replies
+            ))
+
+            if recipient_name != last_recipient:  # Not the last recipient
+                sections.append("<hr>")
+
+        return "\n".join(sections)
+
+    # Single recipient scenario - show paraphrase results
+    paraphrases = consistency_data.get('paraphrases', [])
+    paraphrase_outcomes = consistency_data.get('paraphrase_outcomes', [])
+    paraphrase_replies = consistency_data.get('paraphrase_replies', [])
+
+    return (
+        "<p><strong>Paraphrase Testing Results:</strong></p>\n"
+        + _build_paraphrase_html("Recipient Reply", paraphrases, paraphrase_outcomes, paraphrase_replies)
+    )
\ No newline at end of file
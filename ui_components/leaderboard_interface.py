@@ -4,8 +4,15 @@ Leaderboard Interface Components
 Handles leaderboard display and statistics for completed players.
 """
 
+import pandas as pd
 import streamlit as st
 from datetime import timedelta
+from functools import lru_cache
+
+from session_manager import get_leaderboard_data
+
+# Medal emojis for the top three ranks
+_RANK = ("🥇", "🥈", "🥉")
 
 
 def show_leaderboard_page(session_id: str):
@@ -32,54 +39,65 @@ def show_leaderboard_page(session_id: str):
     _show_statistics_section(leaderboard_data)
 
 
+@st.cache_data(ttl=30, show_spinner="Loading leaderboard...")
+def _fetch_leaderboard():
+    """Fetch leaderboard rows from the database (cached for 30s)"""
+    return get_leaderboard_data()
+
+
 def _get_leaderboard_data():
     """Get leaderboard data with loading spinner"""
-    with st.spinner("Loading leaderboard..."):
-        from session_manager import get_leaderboard_data
-        return get_leaderboard_data()
+    return _fetch_leaderboard()
+
+
+@st.cache_data(show_spinner=False)
+def _leaderboard_df(rows: tuple) -> pd.DataFrame:
+    """Build the display DataFrame from hashable leaderboard rows"""
+    return pd.DataFrame(
+        [
+            {
+                "Rank": _get_rank_emoji(i),
+                "Player": session_display,
+                "Completed": completed_at,
+                "Total Time": _fmt_secs(total_seconds) if total_seconds is not None else "N/A",
+                "Submissions": total_submissions,
+            }
+            for i, (session_display, completed_at, total_seconds, total_submissions)
+            in enumerate(rows, 1)
+        ]
+    )
 
 
 def _show_leaderboard_table(leaderboard_data: list, session_id: str):
     """Show the leaderboard table"""
-    # Create leaderboard table
-    leaderboard_display = []
-    
-    for i, player in enumerate(leaderboard_data, 1):
-        # Format completion time
-        completed_at = player['completed_at'].strftime("%Y-%m-%d %H:%M")
-        
-        # Format total time
-        total_time_str = _format_total_time(player['total_time'])
-        
-        # Add rank emoji
-        rank_emoji = _get_rank_emoji(i)
-        
-        # Highlight current player
-        session_display = player['session_id'][:8] + "..."
-        if player['session_id'] == session_id:
-            session_display = f"**{session_display} (You!)**"
-        
-        leaderboard_display.append({
-            "Rank": rank_emoji,
-            "Player": session_display,
-            "Completed": completed_at,
-            "Total Time": total_time_str,
-            "Submissions": player['total_submissions']
-        })
-    
-    # Display leaderboard table
-    st.table(leaderboard_display)
+    # Flatten to hashable tuples so the DataFrame build caches across reruns
+    rows = tuple(
+        (
+            player['session_id'][:8] + "..." + (" (You!)" if player['session_id'] == session_id else ""),
+            player['completed_at'].strftime("%Y-%m-%d %H:%M"),
+            int(player['total_time'].total_seconds()) if player['total_time'] else None,
+            player['total_submissions'],
+        )
+        for player in leaderboard_data
+    )
+
+    # Display leaderboard table (virtualized, column-wise Arrow encoding)
+    st.dataframe(_leaderboard_df(rows), use_container_width=True, hide_index=True)
 
 
 def _format_total_time(total_time):
     """Format total time duration"""
     if not total_time:
         return "N/A"
-    
-    total_seconds = int(total_time.total_seconds())
+    return _fmt_secs(int(total_time.total_seconds()))
+
+
+@lru_cache(maxsize=256)
+def _fmt_secs(total_seconds: int) -> str:
+    """Format a whole number of seconds as a compact duration string"""
     hours, remainder = divmod(total_seconds, 3600)
     minutes, seconds = divmod(remainder, 60)
-    
+
     if hours > 0:
         return f"{hours}h {minutes}m"
     elif minutes > 0:
@@ -88,40 +106,43 @@ def _format_total_time(total_time):
         return f"{seconds}s"
 
 
+@lru_cache(maxsize=128)
 def _get_rank_emoji(rank: int):
     """Get rank emoji for position"""
-    if rank == 1:
-        return "🥇"
-    elif rank == 2:
-        return "🥈"
-    elif rank == 3:
-        return "🥉"
-    else:
-        return f"{rank}."
+    return _RANK[rank - 1] if rank <= 3 else f"{rank}."
 
 
 def _show_leaderboard_actions():
     """Show action buttons for leaderboard"""
-    col1, col2, col3 = st.columns([1, 1, 1])
-    
-    with col1:
-        if st.button("🔄 Refresh Leaderboard", use_container_width=True):
-            st.rerun()
-    
-    with col2:
-        if st.button("🆕 Start New Game", use_container_width=True):
-            # Clear current session and return to selection screen
-            if 'game_session_id' in st.session_state:
-                del st.session_state.game_session_id
-            if 'show_leaderboard' in st.session_state:
-                del st.session_state.show_leaderboard
-            st.rerun()
-    
-    with col3:
-        if st.button("🎮 Continue Playing", use_container_width=True, help="Return to Level 5"):
-            if 'show_leaderboard' in st.session_state:
-                del st.session_state.show_leaderboard
-            st.rerun()
+    # A single form bundles the three buttons into one widget batch, so a
+    # click triggers one rerun with one websocket round-trip
+    with st.form("leaderboard_actions", clear_on_submit=False, border=False):
+        col1, col2, col3 = st.columns([1, 1, 1])
+
+        with col1:
+            refresh = st.form_submit_button("🔄 Refresh Leaderboard", use_container_width=True)
+
+        with col2:
+            new_game = st.form_submit_button("🆕 Start New Game", use_container_width=True)
+
+        with col3:
+            continue_playing = st.form_submit_button("🎮 Continue Playing", use_container_width=True,
+                                                     help="Return to Level 5")
+
+    if refresh:
+        _fetch_leaderboard.clear()
+        st.rerun()
+    elif new_game:
+        # Clear current session and return to selection screen
+        if 'game_session_id' in st.session_state:
+            del st.session_state.game_session_id
+        if 'show_leaderboard' in st.session_state:
+            del st.session_state.show_leaderboard
+        st.rerun()
+    elif continue_playing:
+        if 'show_leaderboard' in st.session_state:
+            del st.session_state.show_leaderboard
+        st.rerun()
 
 
 def _show_statistics_section(leaderboard_data: list):
@@ -129,9 +150,10 @@ def _show_statistics_section(leaderboard_data: list):
     st.markdown("---")
     with st.expander("📊 Statistics", expanded=False):
         if leaderboard_data:
-            # Calculate some interesting stats
-            total_submissions = sum(p['total_submissions'] for p in leaderboard_data)
-            avg_submissions = total_submissions / len(leaderboard_data) if leaderboard_data else 0
+            # Calculate some interesting stats (single traversal of the dicts)
+            subs = [p['total_submissions'] for p in leaderboard_data]
+            total_submissions = sum(subs)
+            avg_submissions = total_submissions / len(subs)
             
             st.markdown(f"""
             - **Total players completed:** {len(leaderboard_data)}
@@ -148,9 +170,8 @@ def show_game_completion_trigger():
     st.balloons()  # Celebration animation!
     st.success("🏆 **You are now a Communication Master!** 🏆")
     
-    # Wait a moment then redirect to leaderboard
-    import time
-    time.sleep(1)
+    # Redirect to leaderboard immediately; sleeping here would hold the
+    # server thread and stall other sessions
     st.session_state.show_leaderboard = True
     st.session_state.game_completed = False  # Clear the flag
     st.rerun()
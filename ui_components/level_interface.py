@@ -6,28 +6,48 @@ Email-related functionality has been moved to gmail_inbox.py.
 """
 
 import streamlit as st
+from functools import lru_cache
 from config import EMAIL_MAX_CHARS, LEVEL_TO_SCENARIO_MAPPING, MULTI_TURN_LEVELS, MAX_TURNS
+from session_manager import save_current_level_async
 from .html_helpers import create_scenario_display
 from .shared_components import create_level_display
 
 
+@lru_cache(maxsize=1)
+def _nav_helpers():
+    """Resolve navigation helpers from ui_user once.
+
+    ui_user imports this module at load time, so a top-level import would
+    be circular; the cached accessor amortizes the deferred lookup.
+    """
+    from ui_user import determine_previous_level, determine_next_level, clean_stale_level_data
+    return determine_previous_level, determine_next_level, clean_stale_level_data
+
+# Shared empty default for completed_levels reads; frozenset is safe
+# because callers only do membership checks on it
+_EMPTY_SET = frozenset()
+
+# Column spec for the navigation row: prev button, level label, spacer,
+# next button. The last two split the old right column 2:2.5 so the next
+# button keeps its right-aligned position without nested columns.
+_NAV_COLS = (1, 1, 4 / 9, 5 / 9)
+
+
+@st.fragment
 def show_level_navigation(session_id: str, current_level: float):
     """Show level navigation controls"""
-    col1, col2, col3 = st.columns([1, 1, 1])
-    
+    col1, col2, _, button_col = st.columns(_NAV_COLS)
+
     with col1:
         _show_previous_level_button(session_id, current_level)
-    
+
     with col2:
         level_display = create_level_display(current_level)
         st.markdown(f"<div style='text-align: center; font-size: 20px;'><strong>{level_display}</strong></div>", unsafe_allow_html=True)
         # st.markdown(f"<strong>{level_display}</strong>", unsafe_allow_html=True)
-    
-    with col3:
-        # Create sub-columns to push the button to the right
-        _, _, button_col = st.columns([1, 1, 2.5])
-        with button_col:
-            _show_next_level_button(session_id, current_level)
+
+    with button_col:
+        _show_next_level_button(session_id, current_level)
     
     # Level progression info
     # st.info("🎯 **Level Progression**: Complete this level to unlock the next!")
@@ -35,95 +55,102 @@ def show_level_navigation(session_id: str, current_level: float):
 
 def _show_previous_level_button(session_id: str, current_level: float):
     """Show previous level button"""
-    from ui_user import determine_previous_level, clean_stale_level_data
-    from session_manager import save_session_progress
-    
-    previous_level = determine_previous_level(current_level, st.session_state)
+    determine_previous_level, _, clean_stale_level_data = _nav_helpers()
+    ss = st.session_state
+
+    previous_level = determine_previous_level(current_level, ss)
     can_go_back = previous_level is not None
-    
+
     if st.button("← Previous Level", disabled=not can_go_back, help="Go to previous level"):
-        st.session_state.current_level = previous_level
+        ss.current_level = previous_level
         # Clean up stale level data
-        clean_stale_level_data(previous_level, st.session_state)
+        clean_stale_level_data(previous_level, ss)
         # Clear Gmail inbox state to hide Brittany's email by default
         _clear_gmail_inbox_state()
         # Auto-save progress
-        save_session_progress(session_id, st.session_state.current_level, st.session_state.get('completed_levels', set()))
-        
+        save_current_level_async(session_id, previous_level)
+
         # Clear any URL navigation flags and update URL
         _clear_url_navigation_state(previous_level, session_id)
-        
-        st.rerun()
+
+        # Level changes affect the whole page, not just this fragment
+        st.rerun(scope="app")
+
+
+def _level3_next_text(ss, completed_levels, next_level):
+    """Special next-button messaging for Level 3 progression (formerly Level 2)"""
+    strategy_analysis = (ss.get('strategy_analysis') or {}).get(3)
+
+    # Check if forbidden strategies were used
+    used_forbidden_strategies = (strategy_analysis and strategy_analysis.get('used_forbidden_strategies')) or (3.5 in completed_levels)
+
+    if used_forbidden_strategies and next_level == 3.5:
+        return "Challenge Level 3.5 →", "You used forbidden strategies! Try the harder challenge."
+    return None
+
+
+# Levels whose next button carries special text: level -> (text, help) resolver
+_SPECIAL_NEXT = {3: _level3_next_text}
 
 
 def _show_next_level_button(session_id: str, current_level: float):
     """Show next level button"""
-    from ui_user import determine_next_level, clean_stale_level_data
-    from session_manager import save_session_progress
-    
-    next_level = determine_next_level(current_level, st.session_state)
-    can_go_forward = (next_level is not None and 
-                     next_level in LEVEL_TO_SCENARIO_MAPPING and 
-                     current_level in st.session_state.get('completed_levels', set()))
-    
+    _, determine_next_level, clean_stale_level_data = _nav_helpers()
+    ss = st.session_state
+
+    completed_levels = ss.get('completed_levels') or _EMPTY_SET
+    next_level = determine_next_level(current_level, ss)
+    can_go_forward = (next_level is not None and
+                     next_level in LEVEL_TO_SCENARIO_MAPPING and
+                     current_level in completed_levels)
+
     next_level_text = "Next Level →"
     help_text = "Go to next level"
-    
-    # Special messaging for Level 3 progression (formerly Level 2)
-    if current_level == 3 and can_go_forward:
-        strategy_analysis = st.session_state.get('strategy_analysis', {}).get(3)
-        completed_levels = st.session_state.get('completed_levels', set())
-        
-        # Check if forbidden strategies were used
-        used_forbidden_strategies = (strategy_analysis and strategy_analysis.get('used_forbidden_strategies')) or (3.5 in completed_levels)
-        
-        if used_forbidden_strategies and next_level == 3.5:
-            next_level_text = "Challenge Level 3.5 →"
-            help_text = "You used forbidden strategies! Try the harder challenge."
-                
+
+    special = _SPECIAL_NEXT.get(current_level)
+    if special and can_go_forward:
+        override = special(ss, completed_levels, next_level)
+        if override:
+            next_level_text, help_text = override
+
     if st.button(next_level_text, disabled=not can_go_forward, help=help_text):
-        st.session_state.current_level = next_level
+        ss.current_level = next_level
         # Clean up stale level data
-        clean_stale_level_data(next_level, st.session_state)
+        clean_stale_level_data(next_level, ss)
         # Clear Gmail inbox state to hide Brittany's email by default
         _clear_gmail_inbox_state()
         # Auto-save progress
-        save_session_progress(session_id, st.session_state.current_level, st.session_state.get('completed_levels', set()))
-        
+        save_current_level_async(session_id, next_level)
+
         # Clear any URL navigation flags and update URL
         _clear_url_navigation_state(next_level, session_id)
-        
-        st.rerun()
+
+        # Level changes affect the whole page, not just this fragment
+        st.rerun(scope="app")
 
 
 def _clear_url_navigation_state(level: float, session_id: str):
     """Clear URL navigation state and update URL for normal navigation"""
     try:
         # Clear URL navigation processing flags
-        if 'url_navigation_processed' in st.session_state:
-            del st.session_state.url_navigation_processed
-            
+        st.session_state.pop('url_navigation_processed', None)
+
         # Update URL to show only session (no gang_level)
         st.query_params.update({"session": session_id})
-        
+
     except Exception as e:
         # URL updates are not critical
         pass
 
 
+# Keys that control scenario email visibility and Gmail navigation
+_GMAIL_STATE_KEYS = ('show_scenario_email', 'selected_email', 'gmail_view', 'selected_email_id')
+
+
 def _clear_gmail_inbox_state():
     """Clear Gmail inbox state to ensure proper navigation state on level changes"""
-    # Clear the state that controls whether the scenario email is shown
-    if 'show_scenario_email' in st.session_state:
-        del st.session_state.show_scenario_email
-    if 'selected_email' in st.session_state:
-        del st.session_state.selected_email
-    
-    # Clear Gmail-specific navigation state
-    if 'gmail_view' in st.session_state:
-        del st.session_state.gmail_view
-    if 'selected_email_id' in st.session_state:
-        del st.session_state.selected_email_id
+    for key in _GMAIL_STATE_KEYS:
+        st.session_state.pop(key, None)
 
 
 def _update_url_for_navigation(level: float, session_id: str):
@@ -132,13 +159,18 @@ def _update_url_for_navigation(level: float, session_id: str):
     _clear_url_navigation_state(level, session_id)
 
 
+@st.cache_data(show_spinner=False, max_entries=64)
+def _scenario_html(scenario_content: str) -> str:
+    """Render scenario HTML once per distinct scenario text"""
+    return create_scenario_display(scenario_content)
+
+
 def show_scenario_section(scenario_content: str):
     """Show the scenario section"""
     st.subheader("📋 Scenario")
-    
+
     # Display scenario content with proper formatting
-    scenario_html = create_scenario_display(scenario_content)
-    st.markdown(scenario_html, unsafe_allow_html=True)
+    st.markdown(_scenario_html(scenario_content), unsafe_allow_html=True)
 
 
 # def create_email_input_section(level: float, api_keys_available: bool):
@@ -161,35 +193,45 @@ def show_scenario_section(scenario_content: str):
 #     create_level_info_message(level)
 
 
+def _scenario_index(available_scenarios: dict) -> dict:
+    """Get the lowercase filename -> scenario_info index, rebuilding only
+    when the scenario set changes.
+
+    Keyed on the sorted filenames rather than dict identity: the cached
+    scenario loader hands back a fresh dict on every call, so an identity
+    check would rebuild the index every rerun.
+    """
+    key = tuple(sorted(info['filename'] for info in available_scenarios.values()))
+    if st.session_state.get('_scenario_index_key') != key:
+        st.session_state._scenario_index = {
+            info['filename'].lower(): info
+            for info in available_scenarios.values()
+        }
+        st.session_state._scenario_index_key = key
+    return st.session_state._scenario_index
+
+
 def get_scenario_data(level: float, available_scenarios: dict):
     """Get scenario data for a given level"""
     from config import DEFAULT_SCENARIO
-    
+
     # Get backend scenario ID from user level
     backend_scenario_id = LEVEL_TO_SCENARIO_MAPPING.get(level, "5.0")
-    
-    # Get scenario data based on backend scenario ID
-    scenario_data = None
-    scenario_content = ""
-    
+
     if available_scenarios:
-        # Look for the backend scenario ID with exact matching
+        # Look up the backend scenario ID by exact filename
         target_scenario = f"scenario_{backend_scenario_id}.txt"
-        for scenario_name, scenario_info in available_scenarios.items():
-            # Use exact filename matching to avoid partial matches
-            if scenario_info['filename'].lower() == target_scenario.lower():
-                scenario_data = scenario_info
-                scenario_content = scenario_info['content']
-                st.session_state.selected_scenario = scenario_content
-                st.session_state.selected_scenario_file = scenario_info['filename']
-                break
-        
-        if not scenario_data:
+        scenario_info = _scenario_index(available_scenarios).get(target_scenario.lower())
+        if scenario_info:
+            scenario_content = scenario_info['content']
+            st.session_state.selected_scenario = scenario_content
+            st.session_state.selected_scenario_file = scenario_info['filename']
+        else:
             st.warning(f"Level {level} scenario not found. Using default scenario.")
             scenario_content = DEFAULT_SCENARIO
     else:
         # Fallback to default scenario if no scenarios found
         scenario_content = DEFAULT_SCENARIO
         st.warning("No scenarios found in manual folder. Using default scenario.")
-    
-    return scenario_content 
\ No newline at end of file
+
+    return scenario_content
\ No newline at end of file
@@ -4,11 +4,51 @@ Session Interface Components
 Handles session selection, creation, and management UI components.
 """
 
+import glob
+import os
+import threading
+
 import streamlit as st
+from config import SCENARIOS_FOLDER
 from session_manager import create_new_session, session_exists, load_session_data
+from utils import get_script_directory
 from .shared_components import create_session_info_display
 
 
+def _warm_scenario_files():
+    """Read scenario files into the OS page cache ahead of the first level render.
+
+    Runs on a daemon thread with plain file I/O only — no Streamlit calls,
+    since there is no script context off the main thread.
+    """
+    try:
+        folder = SCENARIOS_FOLDER
+        if not os.path.isabs(folder):
+            folder = os.path.join(get_script_directory(), folder)
+        for file_path in glob.glob(os.path.join(folder, "scenario_*.txt")):
+            with open(file_path, 'rb') as f:
+                f.read()
+    except OSError:
+        # Prefetch is best-effort; the render path loads files normally
+        pass
+
+
+# Column spec for the session header bar
+_HEADER_COLS = (2, 1, 1)
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _session_exists_cached(session_id: str) -> bool:
+    """Cache existence checks so repeated resume attempts skip the database"""
+    return session_exists(session_id)
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _load_session_data_cached(session_id: str):
+    """Cache session loads for repeated resume attempts within the TTL"""
+    return load_session_data(session_id)
+
+
 def show_session_selection_screen():
     """Show the session selection screen for starting new or resuming existing sessions"""
     
@@ -43,15 +83,22 @@ def _show_new_session_option():
         try:
             # Create new session
             new_session_id = create_new_session()
-            st.session_state.game_session_id = new_session_id
-            
-            # Initialize session state with default values
-            st.session_state.current_level = 0
-            st.session_state.completed_levels = set()
-            st.session_state.level_emails = {}
-            st.session_state.level_evaluations = {}
-            st.session_state.strategy_analysis = {}
-            st.session_state.use_rubric = False
+
+            # Initialize session state with default values in one batch
+            st.session_state.update({
+                'game_session_id': new_session_id,
+                'current_level': 0,
+                'completed_levels': set(),
+                'level_emails': {},
+                'level_evaluations': {},
+                'strategy_analysis': {},
+                'use_rubric': False,
+                '_balloons_shown': False,
+            })
+
+            # Warm the scenario files in the background so the tutorial
+            # renders without waiting on disk
+            threading.Thread(target=_warm_scenario_files, daemon=True).start()
             
             st.success(f"✅ New session created successfully!")
             st.info(f"📋 **Your Session ID:** `{new_session_id}`")
@@ -76,23 +123,25 @@ def _show_resume_session_option():
         help="Enter the session ID from a previous game"
     )
     
-    if st.button("Resume Game", disabled=not resume_session_id.strip(), use_container_width=True):
-        resume_session_id = resume_session_id.strip()
-        
-        if session_exists(resume_session_id):
+    resume_session_id = resume_session_id.strip()
+
+    if st.button("Resume Game", disabled=not resume_session_id, use_container_width=True):
+        if _session_exists_cached(resume_session_id):
             try:
                 # Load session data
-                session_data = load_session_data(resume_session_id)
+                session_data = _load_session_data_cached(resume_session_id)
                 
                 if session_data:
-                    # Set session ID and load data into session state
-                    st.session_state.game_session_id = resume_session_id
-                    st.session_state.current_level = session_data['current_level']
-                    st.session_state.completed_levels = session_data['completed_levels']
-                    st.session_state.level_emails = session_data['level_emails']
-                    st.session_state.level_evaluations = session_data['level_evaluations']
-                    st.session_state.strategy_analysis = session_data.get('strategy_analysis', {})
-                    st.session_state.use_rubric = session_data['use_rubric']
+                    # Set session ID and load data into session state in one batch
+                    st.session_state.update({
+                        'game_session_id': resume_session_id,
+                        'current_level': session_data['current_level'],
+                        'completed_levels': session_data['completed_levels'],
+                        'level_emails': session_data['level_emails'],
+                        'level_evaluations': session_data['level_evaluations'],
+                        'strategy_analysis': session_data.get('strategy_analysis', {}),
+                        'use_rubric': session_data['use_rubric'],
+                    })
                     
                     # st.success(f"✅ Session resumed successfully!")
                     # st.info(f"📊 Progress: {len(session_data['completed_levels'])} levels completed")
@@ -129,7 +178,7 @@ def _show_session_info_section():
 def show_session_header(session_id: str):
     """Show the session header with navigation options"""
     # Session info bar
-    col1, col2, col3 = st.columns([2, 1, 1])
+    col1, col2, col3 = st.columns(_HEADER_COLS)
     
     with col1:
         create_session_info_display(session_id)
@@ -145,10 +194,8 @@ def show_session_header(session_id: str):
     with col3:
         if st.button("New Session", help="Start a fresh session"):
             # Clear current session and return to selection screen
-            if 'game_session_id' in st.session_state:
-                del st.session_state.game_session_id
-            if 'show_leaderboard' in st.session_state:
-                del st.session_state.show_leaderboard
+            for key in ('game_session_id', 'show_leaderboard'):
+                st.session_state.pop(key, None)
             st.rerun()
     
     st.markdown("---") 
\ No newline at end of file
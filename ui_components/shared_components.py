@@ -7,7 +7,7 @@ different parts of the email game interface to eliminate duplication.
 
 import streamlit as st
 from typing import Optional, Dict, Any
-from config import EMAIL_MAX_CHARS, EMAIL_TEXT_AREA_HEIGHT
+from config import EMAIL_MAX_CHARS, EMAIL_TEXT_AREA_HEIGHT, MAX_TURNS
 from utils import is_multi_recipient_scenario
 
 
@@ -24,7 +24,8 @@ def create_email_textarea(
     help_text: str = "Write your email response",
     value: str = "",
     auto_populate_from_session: bool = False,
-    session_key: Optional[str] = None
+    session_key: Optional[str] = None,
+    level: Optional[float] = None
 ) -> str:
     """
     Create a standardized email text area component.
@@ -44,7 +45,8 @@ def create_email_textarea(
         value: Initial value for the text area
         auto_populate_from_session: Whether to auto-populate from session state
         session_key: Session state key to use for auto-population
-    
+        level: Level whose stored email to auto-populate with
+
     Returns:
         The text content from the text area
     """
@@ -54,20 +56,10 @@ def create_email_textarea(
         session_data = st.session_state.get(session_key, {})
         if isinstance(session_data, str):
             initial_value = session_data
-        elif isinstance(session_data, dict) and session_data:
-            # Get the specific level's email if it exists, otherwise use empty
-            level_from_key = None
-            if 'email_input_level_' in key:
-                try:
-                    level_from_key = float(key.split('email_input_level_')[1].split('_turn_')[0])
-                except (ValueError, IndexError):
-                    pass
-            
-            if level_from_key is not None and level_from_key in session_data:
-                initial_value = session_data[level_from_key]
-            else:
-                initial_value = value  # Use empty value if no data for this specific level
-    
+        elif isinstance(session_data, dict) and level is not None:
+            # Get the specific level's email if it exists, otherwise keep value
+            initial_value = session_data.get(level, value)
+
     return st.text_area(
         label=label,
         value=initial_value,
@@ -100,7 +92,8 @@ def create_level_email_input(
         placeholder=placeholder,
         help_text=help_text,
         auto_populate_from_session=True,
-        session_key='level_emails'
+        session_key='level_emails',
+        level=level
     )
 
 
@@ -331,14 +324,21 @@ def create_session_info_display(session_id: str) -> None:
     st.info(f"📋 **Session ID:** `{session_id}` (copy this to resume the game later)")
 
 
+# Pre-formatted display names for the known levels
+_LEVEL_DISPLAY = {
+    0: "Tutorial",
+    1: "Level 1",
+    2: "Level 2",
+    3: "Level 3",
+    3.5: "Challenge Level 3.5",
+    4: "Level 4",
+    5: "Level 5",
+}
+
+
 def create_level_display(level: float) -> str:
     """Create level display string"""
-    if level == 0:
-        return "Tutorial"
-    elif level == 3.5:
-        return "Challenge Level 3.5"
-    else:
-        return f"Level {int(level)}"
+    return _LEVEL_DISPLAY.get(level) or f"Level {int(level)}"
 
 
 def create_success_message(level: float) -> str:
@@ -376,28 +376,37 @@ def create_turn_limit_display(max_turns: int) -> None:
     st.info("💼 Adam has decided to just bring noise canceling headphones and a blanket to work.")
 
 
+# Level info messages: level -> (display function, message)
+_LEVEL_INFO = {
+    2: (st.info, "💼 **Level 2**: Send an email to multiple recipients."),
+    3: (st.info, "🎯 **Level 3**: Choose your strategy wisely - some approaches may lead to additional challenges!"),
+    3.5: (st.warning, "⚠️ **Challenge Level 3.5**: Forbidden strategies (layoffs, salary increases) are not allowed here!"),
+    4: (st.info, f"📧 **Multi-turn Level**: Figure out Adam's true concerns within {MAX_TURNS} turns."),
+    # 5: (st.info, "🏆 **Final Level**: Demonstrate mastery of all communication skills."),
+}
+
+
 def create_level_info_message(level: float) -> None:
     """Create standardized level info messages"""
-    if level == 2:
-        st.info("💼 **Level 2**: Send an email to multiple recipients.")
-    elif level == 3:
-        st.info("🎯 **Level 3**: Choose your strategy wisely - some approaches may lead to additional challenges!")
-    elif level == 3.5:
-        st.warning("⚠️ **Challenge Level 3.5**: Forbidden strategies (layoffs, salary increases) are not allowed here!")
-    elif level == 4:
-        from config import MAX_TURNS
-        st.info(f"📧 **Multi-turn Level**: Figure out Adam's true concerns within {MAX_TURNS} turns.")
-    # elif level == 5:
-    #     st.info("🏆 **Final Level**: Demonstrate mastery of all communication skills.")
+    entry = _LEVEL_INFO.get(level)
+    if entry:
+        entry[0](entry[1])
 
 
 # =============================================================================
 # LAYOUT & STYLING FUNCTIONS - Spacing, separators, visual formatting
 # =============================================================================
 
+# Padding divs cached by pixel count; callers use a handful of fixed sizes
+_PADDING_CACHE: Dict[int, str] = {}
+
+
 def add_padding(pixels: int = 20) -> None:
     """Add vertical padding using CSS"""
-    st.markdown(f"<div style='padding-top: {pixels}px;'></div>", unsafe_allow_html=True)
+    html = _PADDING_CACHE.get(pixels)
+    if html is None:
+        html = _PADDING_CACHE[pixels] = f"<div style='padding-top: {pixels}px;'></div>"
+    st.markdown(html, unsafe_allow_html=True)
 
 
 def add_separator() -> None:
@@ -405,9 +414,8 @@ def add_separator() -> None:
     st.markdown("---")
 
 
-def show_evaluation_styles():
-    """Inject CSS styles for evaluation display"""
-    st.markdown("""
+# CSS for evaluation display, built once at import time
+_EVAL_STYLES_CSS = """
     <style>
     .quote-box {
         background-color: #fff3cd;
@@ -442,4 +450,14 @@ def show_evaluation_styles():
         margin-top: 0;
     }
     </style>
-    """, unsafe_allow_html=True) 
\ No newline at end of file
+    """
+
+
+def show_evaluation_styles():
+    """Inject CSS styles for evaluation display.
+
+    Emitted on every run: Streamlit drops elements a rerun doesn't
+    re-emit, so gating this behind a session flag would unstyle the
+    evaluation panel after the first rerun.
+    """
+    st.markdown(_EVAL_STYLES_CSS, unsafe_allow_html=True)
\ No newline at end of file
@@ -9,12 +9,25 @@ from config import EMAIL_MAX_CHARS
 from .html_helpers import create_email_display, create_recipient_reply_display
 
 
+def bump_history_version(session_id: str, level: float) -> None:
+    """Invalidate the cached conversation history after a turn write"""
+    key = f"hist_ver_{session_id}_{level}"
+    st.session_state[key] = st.session_state.get(key, 0) + 1
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_history(session_id: str, level: float, version: int):
+    """Fetch conversation history; version bumps invalidate on turn writes"""
+    from session_manager import get_conversation_history
+
+    return get_conversation_history(session_id, level)
+
+
 def show_conversation_history(session_id: str, level: float):
     """Show conversation history for multi-turn levels"""
-    from session_manager import get_conversation_history
-    
-    conversation_history = get_conversation_history(session_id, level)
-    
+    version = st.session_state.get(f"hist_ver_{session_id}_{level}", 0)
+    conversation_history = _cached_history(session_id, level, version)
+
     if conversation_history:
         st.subheader("💬 Conversation History")
         
@@ -146,8 +159,10 @@ def handle_turn_restart(session_id: str, level: float):
     
     # Clear Level data from database
     success = clear_level_data(session_id, level)
-    
+
     if success:
+        # Invalidate the cached conversation history
+        bump_history_version(session_id, level)
         from .shared_components import show_level_restart_success
         show_level_restart_success(level)
     else:
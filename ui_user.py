@@ -369,8 +369,12 @@ def handle_turn_edit(session_id: str, level: float, turn_number: int, new_email_
     """
     # Step 1: Update database and clear future turns
     success = update_turn_and_clear_future(session_id, level, turn_number, new_email_content)
-    
+
     if success:
+        # Invalidate the cached conversation history
+        from ui_components.turn_management import bump_history_version
+        bump_history_version(session_id, level)
+
         # Step 2: Clear session state
         if level in st.session_state.get('level_evaluations', {}):
             del st.session_state.level_evaluations[level]
@@ -445,6 +449,7 @@ def re_evaluate_existing_turn(session_id: str, level: float, turn_number: int,
         # Store debug info in session state so it persists in results
         if 'debug_reply_data' not in st.session_state:
             st.session_state.debug_reply_data = {}
+        reply_result['_is_multi'] = False
         st.session_state.debug_reply_data[level] = reply_result
         
         # Generate evaluation
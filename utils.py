@@ -24,6 +24,7 @@ def get_script_directory() -> str:
     return os.path.dirname(os.path.abspath(__file__))
 
 
+@st.cache_data(ttl=24 * 60 * 60, max_entries=64, show_spinner=False)
 def load_file_content(relative_path: str, fallback_content: str = "") -> str:
     """
     Load content from a file relative to the script directory.
@@ -48,6 +49,7 @@ def load_file_content(relative_path: str, fallback_content: str = "") -> str:
             return ""
 
 
+@st.cache_data(ttl=24 * 60 * 60, max_entries=8, show_spinner=False)
 def load_scenarios_from_folder(folder_path: str = SCENARIOS_FOLDER) -> Dict[str, Dict[str, str]]:
     """Load all scenario files from the specified folder"""
     scenarios = {}
@@ -90,6 +92,7 @@ def load_scenarios_from_folder(folder_path: str = SCENARIOS_FOLDER) -> Dict[str,
     return scenarios
 
 
+@st.cache_data(ttl=24 * 60 * 60, max_entries=64, show_spinner=False)
 def load_recipient_prompt(scenario_filename: str) -> str:
     """Load recipient prompt for a given scenario filename"""
     # Handle None scenario_filename (custom scenarios)
@@ -269,6 +272,7 @@ def initialize_session_state():
             st.session_state[key] = default_value
 
 
+@st.cache_data(ttl=60 * 60, max_entries=1, show_spinner=False)
 def check_api_keys():
     """Check if any API keys are available"""
     return bool(os.getenv("OPENAI_API_KEY") or os.getenv("GROQ_API_KEY") or os.getenv("OPENAI_API_KEY_CLAB"))
@@ -392,6 +396,7 @@ def get_scenario_prompts(scenario_filename: str) -> Dict[str, str]:
     return prompts
 
 
+@st.cache_data(max_entries=32, show_spinner=False)
 def is_multi_recipient_scenario(scenario_filename: str) -> bool:
     """
     Check if a scenario has multiple recipients.
@@ -487,6 +492,7 @@ def has_forwarded_emails(scenario_filename: str) -> bool:
     return len(forwarded_emails) > 0
 
 
+@st.cache_data(ttl=24*60*60, max_entries=32, show_spinner=False)
 def get_all_additional_emails(scenario_filename: str) -> Dict[str, any]:
     """
     Get all additional emails for a scenario (forwarded emails for context).